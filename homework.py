@@ -1,8 +1,22 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from inspect import signature
 
 
-@dataclass
+def _format_message(training_type: str,
+                    duration: float,
+                    distance: float,
+                    speed: float,
+                    calories: float,
+                    ) -> str:
+    """Собрать текст информационного сообщения."""
+    return (f'Тип тренировки: {training_type}; '
+            f'Длительность: {duration:.3f} ч.; '
+            f'Дистанция: {distance:.3f} км; '
+            f'Ср. скорость: {speed:.3f} км/ч; '
+            f'Потрачено ккал: {calories:.3f}.')
+
+
+@dataclass(slots=True)
 class InfoMessage:
     """Информационное сообщение о тренировке."""
     training_type: str
@@ -10,23 +24,20 @@ class InfoMessage:
     distance: float
     speed: float
     calories: float
-    """Можно записать одну строку в одну переменную"""
-    LINE_OUTPUT = ("Тип тренировки: {training_type}; "
-                   "Длительность: {duration:.3f} ч.; "
-                   "Дистанция: {distance:.3f} км; "
-                   "Ср. скорость: {speed:.3f} км/ч; "
-                   "Потрачено ккал: {calories:.3f}.")
 
     def get_message(self) -> str:
-        """Получить дистанцию в км."""
-        return (self.LINE_OUTPUT.format(**asdict(self)))
+        """Получить информационное сообщение."""
+        return _format_message(self.training_type, self.duration,
+                               self.distance, self.speed, self.calories)
 
 
 class Training:
     """Базовый класс тренировки."""
+    NAME: str = 'Training'  # training type shown in the message
     LEN_STEP: float = 0.65  # stride length in meters
-    M_IN_KM: float = 1000  # coefficient for converting meters to kilometers
-    MIN_IN_HOUR: float = 60  # coefficient for converting minutes to hours
+    M_IN_KM: float = 1000.0  # coefficient for converting meters to kilometers
+    MIN_IN_HOUR: float = 60.0  # coefficient for converting minutes to hours
+    _CALORIES_TAKE_SPEED: bool = True  # get_spent_calories accepts `speed`
 
     def __init__(self,
                  action: int,  # action in training
@@ -37,6 +48,15 @@ class Training:
         self.duration_m = duration
         self.weight_kg = weight
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Записать имя подкласса как тип тренировки, если он не задан."""
+        super().__init_subclass__(**kwargs)
+        if 'NAME' not in cls.__dict__:
+            cls.NAME = cls.__name__
+        cls._CALORIES_TAKE_SPEED = (
+            'speed' in signature(cls.get_spent_calories).parameters
+        )
+
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
         return self.action * self.LEN_STEP / self.M_IN_KM
@@ -45,29 +65,47 @@ class Training:
         """Получить среднюю скорость движения."""
         return self.get_distance() / self.duration_m
 
-    def get_spent_calories(self) -> float:
+    def get_spent_calories(self, speed: float | None = None) -> float:
         """Получить количество затраченных калорий."""
         raise NotImplementedError
 
+    def _summary(self) -> tuple[float, float, float]:
+        """Посчитать дистанцию, скорость и калории за один проход."""
+        distance = self.get_distance()
+        if (type(self).get_mean_speed is Training.get_mean_speed
+                and 'get_mean_speed' not in vars(self)):
+            # Training.get_mean_speed without a second get_distance() call
+            speed = distance / self.duration_m
+        else:
+            speed = self.get_mean_speed()
+        if (self._CALORIES_TAKE_SPEED
+                and 'get_spent_calories' not in vars(self)):
+            calories = self.get_spent_calories(speed)
+        else:
+            # old zero-argument override or a method patched on the instance
+            calories = self.get_spent_calories()
+        return distance, speed, calories
+
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        return InfoMessage(self.__class__.__name__,
-                           self.duration_m,
-                           self.get_distance(),
-                           self.get_mean_speed(),
-                           self.get_spent_calories()
-                           )
+        return InfoMessage(self.NAME, self.duration_m, *self._summary())
+
+    def format_message(self) -> str:
+        """Получить текст сообщения, минуя объект `InfoMessage`."""
+        return _format_message(self.NAME, self.duration_m, *self._summary())
 
 
 class Running(Training):
     """Тренировка: бег."""
     # coefficient for calculating calorie
-    VAL_CALORIE_CALC_18: float = 18
-    VAL_CALORIE_CALC_20: float = 20
+    VAL_CALORIE_CALC_18: float = 18.0
+    VAL_CALORIE_CALC_20: float = 20.0
 
-    def get_spent_calories(self) -> float:
+    def get_spent_calories(self, speed: float | None = None) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.VAL_CALORIE_CALC_18 * self.get_mean_speed()
+        if speed is None:
+            speed = self.get_mean_speed()
+        return ((self.VAL_CALORIE_CALC_18 * speed
                 - self.VAL_CALORIE_CALC_20) * self.weight_kg
                 / self.M_IN_KM * self.duration_m
                 * self.MIN_IN_HOUR
@@ -89,10 +127,12 @@ class SportsWalking(Training):
         super().__init__(action, duration, weight)
         self.height_cm = height
 
-    def get_spent_calories(self) -> float:
+    def get_spent_calories(self, speed: float | None = None) -> float:
         """Получить количество затраченных калорий."""
+        if speed is None:
+            speed = self.get_mean_speed()
         return ((self.VAL_CALORIE_CALC_0_035 * self.weight_kg
-                + (self.get_mean_speed()**2
+                + (speed**2
                  // self.height_cm)
                 * self.VAL_CALORIE_CALC_0_029
                 * self.weight_kg) * self.duration_m
@@ -105,7 +145,7 @@ class Swimming(Training):
     # coefficient for calculating calorie
     LEN_STEP: float = 1.38
     VAL_CALORIE_CALC_1_1: float = 1.1
-    VAL_CALORIE_CALC_2: float = 2
+    VAL_CALORIE_CALC_2: float = 2.0
 
     def __init__(self,
                  action: int,
@@ -123,9 +163,11 @@ class Swimming(Training):
         return (self.length_pool * self.count_pool / self.M_IN_KM
                 / self.duration_m)
 
-    def get_spent_calories(self):
+    def get_spent_calories(self, speed: float | None = None) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.get_mean_speed() + self.VAL_CALORIE_CALC_1_1)
+        if speed is None:
+            speed = self.get_mean_speed()
+        return ((speed + self.VAL_CALORIE_CALC_1_1)
                 * self.VAL_CALORIE_CALC_2 * self.weight_kg)
 
     def get_distance(self) -> float:
@@ -133,36 +175,53 @@ class Swimming(Training):
         return self.action * self.LEN_STEP / self.M_IN_KM
 
 
-TRANING_TYPE: list = {'SWM': Swimming,
-                      'RUN': Running,
-                      'WLK': SportsWalking}
+TRANING_TYPE: dict[str, type[Training]] = {'SWM': Swimming,
+                                           'RUN': Running,
+                                           'WLK': SportsWalking}
 
+PACKAGE_FIELDS: dict[str, tuple[str, ...]] = {
+    'SWM': ('action', 'duration', 'weight', 'length_pool', 'count_pool'),
+    'RUN': ('action', 'duration', 'weight'),
+    'WLK': ('action', 'duration', 'weight', 'height'),
+}
 
-def read_package(workout_type: str, data: list) -> Training:
-    """Прочитать данные полученные от датчиков."""
-    if workout_type not in TRANING_TYPE:
+
+def check_package(workout_type: str, data: list) -> type[Training]:
+    """Проверить тип тренировки и число параметров пакета."""
+    training_class = TRANING_TYPE.get(workout_type)
+    if training_class is None:
         raise ValueError('Не верный тип тренировки: {}. '
                          'Допустимые значения: {} '
                          .format(workout_type, ", ".join(TRANING_TYPE)))
-    if (len(signature(TRANING_TYPE[workout_type].__init__).
-            parameters) - 1) == len(data):
-        return TRANING_TYPE[workout_type](*data)
-    else:
+    if len(PACKAGE_FIELDS[workout_type]) != len(data):
         raise TypeError('Отсутсвуют параметры класса {}'
-                        .format(TRANING_TYPE[workout_type].__name__))
+                        .format(training_class.__name__))
+    return training_class
+
+
+def read_package(workout_type: str, data: list) -> Training:
+    """Прочитать данные полученные от датчиков."""
+    return check_package(workout_type, data)(*data)
 
 
 def main(training: Training) -> None:
     """Главная функция."""
-    print(training.show_training_info().get_message())
+    print(training.format_message())
+
+
+def run(packages: list) -> None:
+    """Обработать все пакеты от датчиков по очереди."""
+    read = read_package
+    show = main
+    for workout_type, data in packages:
+        show(read(workout_type, data))
 
 
 if __name__ == '__main__':
     packages = [
-        ('SWM', [720, 1, 80, 25]),
+        ('SWM', [720, 1, 80, 25, 40]),
         ('RUN', [15000, 1, 75]),
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        main(read_package(workout_type, data))
+    run(packages)
@@ -0,0 +1,144 @@
+import numpy as np
+from numba import njit, prange
+
+from homework import (PACKAGE_FIELDS, TRANING_TYPE, InfoMessage, Running,
+                      SportsWalking, Swimming, Training, check_package)
+
+WORKOUT_CODES: dict[str, int] = {'SWM': 0,
+                                 'RUN': 1,
+                                 'WLK': 2}
+
+_VALUE_FIELDS: tuple[str, ...] = ('action', 'duration', 'weight', 'height',
+                                  'length_pool', 'count_pool')
+
+PACKAGE_DTYPE = np.dtype([('kind', 'i1')]
+                         + [(field, 'f8') for field in _VALUE_FIELDS])
+
+
+def read_packages(packages: list) -> np.ndarray:
+    """Собрать пакеты от датчиков в один структурированный массив."""
+    rows = []
+    for workout_type, data in packages:
+        check_package(workout_type, data)
+        values = dict(zip(PACKAGE_FIELDS[workout_type], data))
+        rows.append((WORKOUT_CODES[workout_type],
+                     *(values.get(field, 0.0) for field in _VALUE_FIELDS)))
+    return np.array(rows, dtype=PACKAGE_DTYPE)
+
+
+_M_IN_KM: float = Training.M_IN_KM
+_MIN_IN_HOUR: float = Training.MIN_IN_HOUR
+_SWM_CODE: int = WORKOUT_CODES['SWM']
+_RUN_CODE: int = WORKOUT_CODES['RUN']
+_WLK_CODE: int = WORKOUT_CODES['WLK']
+_RUN_LEN_STEP: float = Running.LEN_STEP
+_RUN_CALORIE_18: float = Running.VAL_CALORIE_CALC_18
+_RUN_CALORIE_20: float = Running.VAL_CALORIE_CALC_20
+_WLK_LEN_STEP: float = SportsWalking.LEN_STEP
+_WLK_CALORIE_0_035: float = SportsWalking.VAL_CALORIE_CALC_0_035
+_WLK_CALORIE_0_029: float = SportsWalking.VAL_CALORIE_CALC_0_029
+_SWM_LEN_STEP: float = Swimming.LEN_STEP
+_SWM_CALORIE_1_1: float = Swimming.VAL_CALORIE_CALC_1_1
+_SWM_CALORIE_2: float = Swimming.VAL_CALORIE_CALC_2
+
+
+@njit(cache=True)
+def _running_row(action: float, duration: float,
+                 weight: float) -> tuple[float, float, float]:
+    """Дистанция, скорость и калории бега, как в `Running`."""
+    distance = action * _RUN_LEN_STEP / _M_IN_KM
+    speed = distance / duration
+    calories = ((_RUN_CALORIE_18 * speed - _RUN_CALORIE_20) * weight
+                / _M_IN_KM * duration * _MIN_IN_HOUR)
+    return distance, speed, calories
+
+
+@njit(cache=True)
+def _walking_row(action: float, duration: float, weight: float,
+                 height: float) -> tuple[float, float, float]:
+    """Дистанция, скорость и калории ходьбы, как в `SportsWalking`."""
+    distance = action * _WLK_LEN_STEP / _M_IN_KM
+    speed = distance / duration
+    calories = ((_WLK_CALORIE_0_035 * weight
+                + (speed**2 // height) * _WLK_CALORIE_0_029 * weight)
+                * duration * _MIN_IN_HOUR)
+    return distance, speed, calories
+
+
+@njit(cache=True)
+def _swimming_row(action: float, duration: float, weight: float,
+                  length_pool: float,
+                  count_pool: float) -> tuple[float, float, float]:
+    """Дистанция, скорость и калории плавания, как в `Swimming`."""
+    distance = action * _SWM_LEN_STEP / _M_IN_KM
+    speed = length_pool * count_pool / _M_IN_KM / duration
+    calories = (speed + _SWM_CALORIE_1_1) * _SWM_CALORIE_2 * weight
+    return distance, speed, calories
+
+
+@njit(cache=True, parallel=True)
+def _batch_kernel(kind: np.ndarray,
+                  action: np.ndarray,
+                  duration: np.ndarray,
+                  weight: np.ndarray,
+                  height: np.ndarray,
+                  length_pool: np.ndarray,
+                  count_pool: np.ndarray,
+                  ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Посчитать результаты по столбцам пакета за один параллельный проход."""
+    distance = np.empty(kind.shape[0], dtype=np.float64)
+    speed = np.empty(kind.shape[0], dtype=np.float64)
+    calories = np.empty(kind.shape[0], dtype=np.float64)
+    for i in prange(kind.shape[0]):
+        if kind[i] == _RUN_CODE:
+            row = _running_row(action[i], duration[i], weight[i])
+        elif kind[i] == _WLK_CODE:
+            row = _walking_row(action[i], duration[i], weight[i],
+                               height[i])
+        elif kind[i] == _SWM_CODE:
+            row = _swimming_row(action[i], duration[i], weight[i],
+                                length_pool[i], count_pool[i])
+        else:
+            # unreachable through compute_batch, which rejects bad codes
+            row = (np.nan, np.nan, np.nan)
+        distance[i] = row[0]
+        speed[i] = row[1]
+        calories[i] = row[2]
+    return distance, speed, calories
+
+
+def compute_batch(batch: np.ndarray
+                  ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Рассчитать дистанцию, скорость и калории для `read_packages`."""
+    unknown = ~np.isin(batch['kind'], list(WORKOUT_CODES.values()))
+    if unknown.any():
+        raise ValueError('Не верный код тренировки: {}. '
+                         'Допустимые значения: {} '
+                         .format(batch['kind'][unknown][0],
+                                 ", ".join(map(str, WORKOUT_CODES.values()))))
+    if not batch['duration'].all():
+        raise ZeroDivisionError('float division by zero')
+    if not batch['height'][batch['kind'] == _WLK_CODE].all():
+        raise ZeroDivisionError('float floor division by zero')
+    return _batch_kernel(batch['kind'], batch['action'],
+                         batch['duration'], batch['weight'],
+                         batch['height'], batch['length_pool'],
+                         batch['count_pool'])
+
+
+def calories_batch(batch: np.ndarray) -> np.ndarray:
+    """Рассчитать калории для массива из `read_packages`."""
+    return compute_batch(batch)[2]
+
+
+def run_batch(packages: list) -> None:
+    """Обработать все пакеты от датчиков одним векторным проходом."""
+    batch = read_packages(packages)
+    distance, speed, calories = compute_batch(batch)
+    for (workout_type, _), *row in zip(packages,
+                                       batch['duration'].tolist(),
+                                       distance.tolist(),
+                                       speed.tolist(),
+                                       calories.tolist()):
+        print(InfoMessage(TRANING_TYPE[workout_type].NAME,
+                          *row).get_message())
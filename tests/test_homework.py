@@ -363,3 +363,177 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('input_data', [
+    (['SWM', [720, 1, 80, 25, 40]]),
+    (['RUN', [1206, 12, 6]]),
+    (['WLK', [9000, 1, 75, 180]]),
+])
+def test_show_training_info_uses_get_spent_calories(input_data):
+    workout_type, data = input_data
+    training_class = homework.TRANING_TYPE[workout_type]
+
+    class Overridden(training_class):
+        def get_spent_calories(self, speed=None):
+            return 42.0
+
+    result = Overridden(*data).show_training_info()
+    assert result.calories == 42.0, (
+        'Метод `show_training_info` должен брать калории '
+        'из `get_spent_calories`.'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    (['SWM', [720, 1, 80, 25, 40]]),
+    (['RUN', [1206, 12, 6]]),
+    (['WLK', [9000, 1, 75, 180]]),
+])
+def test_show_training_info_uses_get_mean_speed(input_data):
+    workout_type, data = input_data
+    training_class = homework.TRANING_TYPE[workout_type]
+
+    class Overridden(training_class):
+        def get_mean_speed(self):
+            return 1.0
+
+    training = Overridden(*data)
+    result = training.show_training_info()
+    assert result.speed == 1.0, (
+        'Метод `show_training_info` должен брать скорость '
+        'из `get_mean_speed`.'
+    )
+    assert result.calories == training.get_spent_calories(), (
+        'Калории в `show_training_info` должны считаться '
+        'по скорости из `get_mean_speed`.'
+    )
+
+
+def test_show_training_info_zero_argument_override():
+    class Legacy(homework.Running):
+        def get_spent_calories(self):
+            return 42.0
+
+    assert Legacy(9000, 1, 75).show_training_info().calories == 42.0, (
+        'Метод `show_training_info` должен поддерживать '
+        '`get_spent_calories` без аргумента скорости.'
+    )
+
+
+def test_show_training_info_calls_get_spent_calories_once():
+    calls = []
+
+    class Broken(homework.Running):
+        def get_spent_calories(self, speed=None):
+            calls.append(speed)
+            raise TypeError('broken formula')
+
+    with pytest.raises(TypeError, match='broken formula'):
+        Broken(9000, 1, 75).show_training_info()
+    assert calls == [5.85], (
+        'Метод `show_training_info` должен вызывать '
+        '`get_spent_calories` один раз.'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    (['SWM', [720, 1, 80, 25, 40]]),
+    (['RUN', [1206, 12, 6]]),
+    (['WLK', [9000, 1, 75, 180]]),
+])
+def test_show_training_info_computes_distance_once(input_data):
+    workout_type, data = input_data
+    training_class = homework.TRANING_TYPE[workout_type]
+    calls = []
+
+    class Counted(training_class):
+        def get_distance(self):
+            calls.append(1)
+            return super().get_distance()
+
+    training = Counted(*data)
+    result = training.show_training_info()
+    assert len(calls) == 1, (
+        'Метод `show_training_info` должен считать дистанцию один раз.'
+    )
+    assert result.speed == training.get_mean_speed(), (
+        'Проверьте формулу подсчёта средней скорости '
+        'в `show_training_info`.'
+    )
+
+
+def test_show_training_info_subclass_name():
+    class Trail(homework.Running):
+        pass
+
+    training = Trail(9000, 1, 75)
+    assert training.show_training_info().training_type == 'Trail', (
+        'Тип тренировки в сообщении должен совпадать с именем класса.'
+    )
+    assert training.format_message().startswith('Тип тренировки: Trail;'), (
+        'Тип тренировки в сообщении должен совпадать с именем класса.'
+    )
+
+
+    class Jogging(homework.Running):
+        NAME = 'Бег трусцой'
+
+    training = Jogging(9000, 1, 75)
+    assert training.show_training_info().training_type == 'Бег трусцой', (
+        'Заданный в подклассе `NAME` должен попадать в сообщение.'
+    )
+
+
+def test_show_training_info_uses_patched_get_spent_calories(monkeypatch):
+    training = homework.Running(9000, 1, 75)
+
+    def mock_get_spent_calories():
+        return 100.0
+    monkeypatch.setattr(
+        training,
+        'get_spent_calories',
+        mock_get_spent_calories
+    )
+    assert training.show_training_info().calories == 100.0, (
+        'Метод `show_training_info` должен брать калории '
+        'из `get_spent_calories`.'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    (['SWM', [720, 1, 80, 25, 40]]),
+    (['RUN', [1206, 12, 6]]),
+    (['WLK', [9000, 1, 75, 180]]),
+])
+def test_Training_format_message(input_data):
+    training = homework.read_package(*input_data)
+    assert training.format_message() == (
+        training.show_training_info().get_message()
+    ), (
+        'Метод `format_message` должен возвращать тот же текст, '
+        'что и `show_training_info().get_message()`.'
+    )
+
+
+def test_run():
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('WLK', [9000, 1, 75, 180]),
+    ]
+    with Capturing() as run_output:
+        homework.run(packages)
+    assert run_output == [
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.',
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 157.500.',
+    ], (
+        'Функция `run` должна печатать сообщение для каждого пакета.'
+    )
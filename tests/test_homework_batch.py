@@ -0,0 +1,101 @@
+import pytest
+from conftest import Capturing
+
+import homework
+import homework_batch
+
+
+BATCH_PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('SWM', [420, 4, 20, 42, 4]),
+    ('SWM', [1206, 12, 6, 12, 6]),
+    ('RUN', [9000, 1, 75]),
+    ('RUN', [420, 4, 20]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('WLK', [420, 4, 20, 42]),
+    ('WLK', [1206, 12, 6, 12]),
+]
+
+
+def test_compute_batch():
+    batch = homework_batch.read_packages(BATCH_PACKAGES)
+    distance, speed, calories = homework_batch.compute_batch(batch)
+    result = list(zip(distance.tolist(), speed.tolist(), calories.tolist()))
+    expected = []
+    for workout_type, data in BATCH_PACKAGES:
+        training = homework.read_package(workout_type, data)
+        expected.append((training.get_distance(),
+                         training.get_mean_speed(),
+                         training.get_spent_calories()))
+    assert result == expected, (
+        'Функция `compute_batch` должна считать дистанцию, скорость '
+        'и калории так же, как методы классов тренировок.'
+    )
+
+
+@pytest.mark.parametrize('input_data, error', [
+    (('XYZ', [720, 1, 80]), ValueError),
+    (('SWM', [720, 1, 80, 25]), TypeError),
+])
+def test_read_packages_checks_like_read_package(input_data, error):
+    with pytest.raises(error) as single:
+        homework.read_package(*input_data)
+    with pytest.raises(error) as batch:
+        homework_batch.read_packages([input_data])
+    assert str(batch.value) == str(single.value), (
+        'Функции `read_package` и `read_packages` должны '
+        'одинаково проверять пакеты.'
+    )
+
+
+def test_compute_batch_rejects_unknown_kind():
+    batch = homework_batch.read_packages([('RUN', [9000, 1, 75])])
+    batch['kind'][0] = 7
+    with pytest.raises(ValueError):
+        homework_batch.compute_batch(batch)
+
+
+def test_compute_batch_zero_duration():
+    with pytest.raises(ZeroDivisionError):
+        homework.read_package('RUN', [100, 0, 75]).get_spent_calories()
+    batch = homework_batch.read_packages([('RUN', [100, 0, 75])])
+    with pytest.raises(ZeroDivisionError):
+        homework_batch.calories_batch(batch)
+
+
+def test_compute_batch_zero_height():
+    with pytest.raises(ZeroDivisionError):
+        homework.read_package('WLK', [9000, 1, 75, 0]).get_spent_calories()
+    batch = homework_batch.read_packages([
+        ('WLK', [9000, 1, 75, 180]),
+        ('WLK', [9000, 1, 75, 0]),
+    ])
+    with pytest.raises(ZeroDivisionError):
+        homework_batch.calories_batch(batch)
+
+
+def test_calories_batch():
+    batch = homework_batch.read_packages([
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [9000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('RUN', [1206, 12, 6]),
+    ])
+    result = homework_batch.calories_batch(batch)
+    assert result.tolist() == [
+        336.0, 383.85, 157.50000000000003, -81.32032799999999
+    ], (
+        'Функция `calories_batch` должна считать калории '
+        'так же, как методы классов тренировок.'
+    )
+
+
+def test_run_batch():
+    with Capturing() as run_output:
+        homework.run(BATCH_PACKAGES)
+    with Capturing() as run_batch_output:
+        homework_batch.run_batch(BATCH_PACKAGES)
+    assert run_batch_output == run_output, (
+        'Функция `run_batch` должна печатать те же сообщения, что и `run`.'
+    )